@@ -15,10 +15,16 @@
 # limitations under the License.
 #
 
+import copy
+import dataclasses
 import datetime
+import functools
+import os
+import sys
 import time
 from typing import Dict, List, Literal, Optional, Sequence, Tuple, Union
 from google.protobuf import json_format
+from google.protobuf import struct_pb2
 
 import abc
 
@@ -50,13 +56,8 @@ from google.cloud.aiplatform.compat.types import (
 from google.cloud.aiplatform.utils import _timestamped_gcs_dir
 from google.cloud.aiplatform.utils import source_utils
 from google.cloud.aiplatform.utils import worker_spec_utils
-from google.cloud.aiplatform.utils import column_transformations_utils
 from google.cloud.aiplatform.utils import _explanation_utils
 
-from google.cloud.aiplatform.v1.schema.trainingjob import (
-    definition_v1 as training_job_inputs,
-)
-
 from google.rpc import code_pb2
 from google.rpc import status_pb2
 
@@ -80,6 +81,141 @@ _LOG_WAIT_TIME = 5
 _MAX_WAIT_TIME = 60 * 5  # 5 minute wait
 _WAIT_TIME_MULTIPLIER = 2  # scale wait by 2 every iteration
 
+# Training task input keys, interned once so per-submission dict construction
+# hashes them by pointer comparison instead of re-hashing fresh strings.
+_WORKER_POOL_SPECS_KEY = sys.intern("worker_pool_specs")
+_BASE_OUTPUT_DIRECTORY_KEY = sys.intern("base_output_directory")
+_OUTPUT_URI_PREFIX_KEY = sys.intern("output_uri_prefix")
+_SERVICE_ACCOUNT_KEY = sys.intern("service_account")
+_NETWORK_KEY = sys.intern("network")
+_TENSORBOARD_KEY = sys.intern("tensorboard")
+_ENABLE_WEB_ACCESS_KEY = sys.intern("enable_web_access")
+_ENABLE_DASHBOARD_ACCESS_KEY = sys.intern("enable_dashboard_access")
+_PERSISTENT_RESOURCE_ID_KEY = sys.intern("persistent_resource_id")
+_SCHEDULING_KEY = sys.intern("scheduling")
+_TIMEOUT_KEY = sys.intern("timeout")
+_RESTART_JOB_ON_WORKER_RESTART_KEY = sys.intern("restart_job_on_worker_restart")
+_DISABLE_RETRIES_KEY = sys.intern("disable_retries")
+_STRATEGY_KEY = sys.intern("strategy")
+_MAX_WAIT_DURATION_KEY = sys.intern("max_wait_duration")
+_TARGET_COLUMN_KEY = sys.intern("targetColumn")
+_TIME_COLUMN_KEY = sys.intern("timeColumn")
+_TIME_SERIES_IDENTIFIER_COLUMN_KEY = sys.intern("timeSeriesIdentifierColumn")
+_UNAVAILABLE_AT_FORECAST_COLUMNS_KEY = sys.intern("unavailableAtForecastColumns")
+_AVAILABLE_AT_FORECAST_COLUMNS_KEY = sys.intern("availableAtForecastColumns")
+_FORECAST_HORIZON_KEY = sys.intern("forecastHorizon")
+_DATA_GRANULARITY_KEY = sys.intern("dataGranularity")
+_TRANSFORMATIONS_KEY = sys.intern("transformations")
+_TRAIN_BUDGET_MILLI_NODE_HOURS_KEY = sys.intern("trainBudgetMilliNodeHours")
+
+# Hoisted once at import: the reduction-server pool index and the custom task
+# schema uri, both otherwise re-resolved through module attribute chains on
+# every submission.
+_SERVER_SPEC_ORDER = worker_spec_utils._SPEC_ORDERS["server_spec"]
+_CUSTOM_TASK_DEFINITION = schema.training_job.definition.custom_task
+
+# Default column transformations inferred from a dataset's schema, keyed by
+# (dataset resource name, target column). Inference fetches the schema from
+# the service, so jobs trained on the same dataset reuse the first result.
+_default_column_transformations_cache = {}
+
+# Data granularity units accepted by forecasting jobs and, for the `minute`
+# unit, the data granularity counts the service accepts. Checked client-side
+# so bad inputs fail before the create RPC.
+_DATA_GRANULARITY_UNITS = frozenset(("minute", "hour", "day", "week", "month", "year"))
+_MINUTE_DATA_GRANULARITY_COUNTS = frozenset((1, 5, 10, 15, 30))
+
+# Registry of the optional training task input keys, in the order their values
+# are gathered in _prepare_training_task_inputs_and_output_dir. Keeping the key
+# order at module level lets the method assemble the inputs in a single pass.
+_OPTIONAL_TRAINING_TASK_INPUT_KEYS = (
+    _SERVICE_ACCOUNT_KEY,
+    _NETWORK_KEY,
+    _TENSORBOARD_KEY,
+    _ENABLE_WEB_ACCESS_KEY,
+    _ENABLE_DASHBOARD_ACCESS_KEY,
+    _PERSISTENT_RESOURCE_ID_KEY,
+)
+
+# Registry of the optional forecasting training task input keys, in the order
+# their values are gathered in _ForecastingTrainingJob._run.
+_OPTIONAL_FORECASTING_INPUT_KEYS = (
+    sys.intern("timeSeriesAttributeColumns"),
+    sys.intern("weightColumn"),
+    sys.intern("contextWindow"),
+    sys.intern("quantiles"),
+    sys.intern("validationOptions"),
+    sys.intern("optimizationObjective"),
+    sys.intern("holidayRegions"),
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_chief_worker_pool_specs(
+    replica_count: int,
+    machine_type: str,
+    accelerator_count: int,
+    accelerator_type: str,
+    boot_disk_type: str,
+    boot_disk_size_gb: int,
+    reduction_server_replica_count: int,
+    reduction_server_machine_type: Optional[str],
+    tpu_topology: Optional[str],
+    reservation_affinity_type: Optional[str],
+    reservation_affinity_key: Optional[str],
+    reservation_affinity_values: Optional[Tuple[str, ...]],
+) -> List[Dict]:
+    """Validates and builds chief/worker pool specs, memoized by arguments.
+
+    Hyperparameter sweeps submit many jobs with identical machine specs;
+    memoizing skips re-validating the same spec on every submission. Callers
+    must deep copy the returned list before mutating it.
+    """
+    return worker_spec_utils._DistributedTrainingSpec.chief_worker_pool(
+        replica_count=replica_count,
+        machine_type=machine_type,
+        accelerator_count=accelerator_count,
+        accelerator_type=accelerator_type,
+        boot_disk_type=boot_disk_type,
+        boot_disk_size_gb=boot_disk_size_gb,
+        reduction_server_replica_count=reduction_server_replica_count,
+        reduction_server_machine_type=reduction_server_machine_type,
+        tpu_topology=tpu_topology,
+        reservation_affinity_type=reservation_affinity_type,
+        reservation_affinity_key=reservation_affinity_key,
+        reservation_affinity_values=(
+            list(reservation_affinity_values)
+            if reservation_affinity_values is not None
+            else None
+        ),
+    ).pool_specs
+
+
+# Documented CustomJob limit on container environment variables.
+_MAX_ENVIRONMENT_VARIABLES = 10
+
+
+def _validate_environment_variables(
+    environment_variables: Optional[Dict[str, str]]
+) -> None:
+    """Validates the environment variable count before any RPC is made.
+
+    Args:
+        environment_variables (Dict[str, str]):
+            Optional. Environment variables to be passed to the container.
+
+    Raises:
+        ValueError: If more than 10 environment variables are passed.
+    """
+    if (
+        environment_variables
+        and len(environment_variables) > _MAX_ENVIRONMENT_VARIABLES
+    ):
+        raise ValueError(
+            "At most %d environment variables can be specified but %d were "
+            "given." % (_MAX_ENVIRONMENT_VARIABLES, len(environment_variables))
+        )
+
 
 class _TrainingJob(base.VertexAiStatefulResource):
 
@@ -483,19 +619,15 @@ class _TrainingJob(base.VertexAiStatefulResource):
             fraction_split = None
 
             # Create filter split
-            if any(
-                [
-                    training_filter_split is not None,
-                    validation_filter_split is not None,
-                    test_filter_split is not None,
-                ]
+            if (
+                training_filter_split is not None
+                or validation_filter_split is not None
+                or test_filter_split is not None
             ):
-                if all(
-                    [
-                        training_filter_split is not None,
-                        validation_filter_split is not None,
-                        test_filter_split is not None,
-                    ]
+                if (
+                    training_filter_split is not None
+                    and validation_filter_split is not None
+                    and test_filter_split is not None
                 ):
                     filter_split = gca_training_pipeline.FilterSplit(
                         training_filter=training_filter_split,
@@ -521,12 +653,10 @@ class _TrainingJob(base.VertexAiStatefulResource):
                     test_fraction=test_fraction_split,
                     key=timestamp_split_column_name,
                 )
-            elif any(
-                [
-                    training_fraction_split is not None,
-                    validation_fraction_split is not None,
-                    test_fraction_split is not None,
-                ]
+            elif (
+                training_fraction_split is not None
+                or validation_fraction_split is not None
+                or test_fraction_split is not None
             ):
                 fraction_split = gca_training_pipeline.FractionSplit(
                     training_fraction=training_fraction_split,
@@ -1117,6 +1247,11 @@ class _CustomTrainingJob(_TrainingJob):
 
     _supported_training_schemas = (schema.training_job.definition.custom_task,)
 
+    # Class-level defaults so instances built through _empty_constructor
+    # (e.g. by get()) have them without running __init__.
+    _callback_is_noop = False
+    _backing_custom_job_name = None
+
     def __init__(
         self,
         # TODO(b/223262536): Make display_name parameter fully optional in next major release
@@ -1306,12 +1441,10 @@ class _CustomTrainingJob(_TrainingJob):
         self._container_uri = container_uri
 
         model_predict_schemata = None
-        if any(
-            [
-                model_instance_schema_uri,
-                model_parameters_schema_uri,
-                model_prediction_schema_uri,
-            ]
+        if (
+            model_instance_schema_uri
+            or model_parameters_schema_uri
+            or model_prediction_schema_uri
         ):
             model_predict_schemata = gca_model.PredictSchemata(
                 instance_schema_uri=model_instance_schema_uri,
@@ -1372,6 +1505,13 @@ class _CustomTrainingJob(_TrainingJob):
         # this flags keeps that state so we don't log it multiple times
         self._has_logged_custom_job = False
         self._logged_web_access_uris = set()
+        # Set once there is nothing left for _wait_callback to log so
+        # subsequent polls can return immediately.
+        self._callback_is_noop = False
+        # Cached resource name of the backing custom job. The name never
+        # changes once the server populates it, so it is looked up from the
+        # training task metadata at most once.
+        self._backing_custom_job_name = None
 
     @property
     def network(self) -> Optional[str]:
@@ -1409,6 +1549,7 @@ class _CustomTrainingJob(_TrainingJob):
         ] = None,
         reservation_affinity_key: Optional[str] = None,
         reservation_affinity_values: Optional[List[str]] = None,
+        skip_validation: bool = False,
     ) -> Tuple[worker_spec_utils._DistributedTrainingSpec, Optional[gca_model.Model]]:
         """Create worker pool specs and managed model as well validating the
         run.
@@ -1473,6 +1614,11 @@ class _CustomTrainingJob(_TrainingJob):
                 Optional. Corresponds to the label values of a reservation resource.
                 This must be the full resource name of the reservation.
                 Format: 'projects/{project_id_or_number}/zones/{zone}/reservations/{reservation_name}'
+            skip_validation (bool):
+                Optional. Whether to skip client-side validation of the display
+                name and labels. Intended for trusted programmatic callers,
+                such as sweeps that validated the arguments upstream and
+                submit many jobs with them. Defaults to False.
 
         Returns:
             Worker pools specs and managed model for run.
@@ -1480,6 +1626,7 @@ class _CustomTrainingJob(_TrainingJob):
         Raises:
             RuntimeError: If Training job has already been run or model_display_name was
                 provided but required arguments were not provided in constructor.
+            ValueError: If boot_disk_size_gb is outside the range of [100, 64000].
         """
 
         if self._is_waiting_to_run():
@@ -1500,9 +1647,17 @@ class _CustomTrainingJob(_TrainingJob):
         if self._managed_model.container_spec.image_uri:
             model_display_name = model_display_name or self._display_name + "-model"
 
-        # validates args and will raise
-        worker_pool_specs = (
-            worker_spec_utils._DistributedTrainingSpec.chief_worker_pool(
+        # Fail fast locally instead of waiting for the service round trip.
+        if not skip_validation and not 100 <= boot_disk_size_gb <= 64000:
+            raise ValueError(
+                "boot_disk_size_gb must be within the range of [100, 64000] "
+                "but was %d." % boot_disk_size_gb
+            )
+
+        # validates args and will raise. Deep copied because the cached specs
+        # are shared across calls and downstream code mutates them.
+        worker_pool_specs = copy.deepcopy(
+            _cached_chief_worker_pool_specs(
                 replica_count=replica_count,
                 machine_type=machine_type,
                 accelerator_count=accelerator_count,
@@ -1514,16 +1669,22 @@ class _CustomTrainingJob(_TrainingJob):
                 tpu_topology=tpu_topology,
                 reservation_affinity_type=reservation_affinity_type,
                 reservation_affinity_key=reservation_affinity_key,
-                reservation_affinity_values=reservation_affinity_values,
-            ).pool_specs
+                reservation_affinity_values=(
+                    tuple(reservation_affinity_values)
+                    if reservation_affinity_values is not None
+                    else None
+                ),
+            )
         )
 
         managed_model = self._managed_model
         if model_display_name:
-            utils.validate_display_name(model_display_name)
+            if not skip_validation:
+                utils.validate_display_name(model_display_name)
             managed_model.display_name = model_display_name
             if model_labels:
-                utils.validate_labels(model_labels)
+                if not skip_validation:
+                    utils.validate_labels(model_labels)
                 managed_model.labels = model_labels
             else:
                 managed_model.labels = self._labels
@@ -1553,7 +1714,7 @@ class _CustomTrainingJob(_TrainingJob):
         persistent_resource_id: Optional[str] = None,
         scheduling_strategy: Optional[gca_custom_job_compat.Scheduling.Strategy] = None,
         max_wait_duration: Optional[int] = None,
-    ) -> Tuple[Dict, str]:
+    ) -> Tuple[struct_pb2.Value, str]:
         """Prepares training task inputs and output directory for custom job.
 
         Args:
@@ -1628,61 +1789,76 @@ class _CustomTrainingJob(_TrainingJob):
 
         _LOGGER.info("Training Output directory:\n%s " % base_output_dir)
 
+        optional_values = (
+            service_account,
+            network,
+            tensorboard,
+            enable_web_access,
+            enable_dashboard_access,
+            persistent_resource_id,
+        )
         training_task_inputs = {
-            "worker_pool_specs": worker_pool_specs,
-            "base_output_directory": {"output_uri_prefix": base_output_dir},
+            _WORKER_POOL_SPECS_KEY: worker_pool_specs,
+            _BASE_OUTPUT_DIRECTORY_KEY: {_OUTPUT_URI_PREFIX_KEY: base_output_dir},
+            **{
+                key: value
+                for key, value in zip(
+                    _OPTIONAL_TRAINING_TASK_INPUT_KEYS, optional_values
+                )
+                if value
+            },
         }
 
-        if service_account:
-            training_task_inputs["service_account"] = service_account
-        if network:
-            training_task_inputs["network"] = network
-        if tensorboard:
-            training_task_inputs["tensorboard"] = tensorboard
-        if enable_web_access:
-            training_task_inputs["enable_web_access"] = enable_web_access
-        if enable_dashboard_access:
-            training_task_inputs["enable_dashboard_access"] = enable_dashboard_access
-        if persistent_resource_id:
-            training_task_inputs["persistent_resource_id"] = persistent_resource_id
+        scheduling = {
+            key: value
+            for key, value in (
+                (_TIMEOUT_KEY, f"{timeout}s" if timeout else None),
+                (_RESTART_JOB_ON_WORKER_RESTART_KEY, restart_job_on_worker_restart),
+                (_DISABLE_RETRIES_KEY, disable_retries),
+                (_STRATEGY_KEY, scheduling_strategy),
+                (
+                    _MAX_WAIT_DURATION_KEY,
+                    f"{max_wait_duration}s" if max_wait_duration else None,
+                ),
+            )
+            if value
+        }
+        if scheduling:
+            training_task_inputs[_SCHEDULING_KEY] = scheduling
 
-        if (
-            timeout
-            or restart_job_on_worker_restart
-            or disable_retries
-            or scheduling_strategy
-            or max_wait_duration
-        ):
-            timeout = f"{timeout}s" if timeout else None
-            max_wait_duration = f"{max_wait_duration}s" if max_wait_duration else None
-            scheduling = {
-                "timeout": timeout,
-                "restart_job_on_worker_restart": restart_job_on_worker_restart,
-                "disable_retries": disable_retries,
-                "strategy": scheduling_strategy,
-                "max_wait_duration": max_wait_duration,
-            }
-            training_task_inputs["scheduling"] = scheduling
+        # Convert once through the C-accelerated ParseDict rather than letting
+        # proto-plus marshal the nested dict key by key in Python.
+        training_task_inputs = json_format.ParseDict(
+            training_task_inputs, struct_pb2.Value()
+        )
 
         return training_task_inputs, base_output_dir
 
     @property
     def web_access_uris(self) -> Dict[str, str]:
         """Returns the URIs used to access the custom training job."""
-        web_access_uris = dict()
-        if (
-            self._gca_resource.training_task_metadata
-            and self._gca_resource.training_task_metadata.get("backingCustomJob")
-        ):
-            custom_job_resource_name = self._gca_resource.training_task_metadata.get(
-                "backingCustomJob"
-            )
+        web_access_uris = {}
+        custom_job_resource_name = self._get_backing_custom_job_name()
+        if custom_job_resource_name:
             custom_job = jobs.CustomJob.get(resource_name=custom_job_resource_name)
 
-            web_access_uris = dict(custom_job.web_access_uris)
+            web_access_uris = {**custom_job.web_access_uris}
 
         return web_access_uris
 
+    def _get_backing_custom_job_name(self) -> Optional[str]:
+        """Returns the resource name of the backing custom job, if known.
+
+        The name is cached on first retrieval since it never changes once the
+        server populates the training task metadata.
+        """
+        if self._backing_custom_job_name is None:
+            if self._gca_resource.training_task_metadata:
+                self._backing_custom_job_name = (
+                    self._gca_resource.training_task_metadata.get("backingCustomJob")
+                )
+        return self._backing_custom_job_name
+
     def _log_web_access_uris(self):
         """Helper method to log the web access uris of the backing custom job"""
         for worker, uri in self.web_access_uris.items():
@@ -1699,43 +1875,44 @@ class _CustomTrainingJob(_TrainingJob):
                 self._logged_web_access_uris.add(uri)
 
     def _wait_callback(self):
-        if (
-            self._gca_resource.training_task_metadata
-            and self._gca_resource.training_task_metadata.get("backingCustomJob")
-            and not self._has_logged_custom_job
-        ):
+        if self._callback_is_noop:
+            return
+
+        # Bind the proto field once; each attribute access walks descriptor
+        # machinery and this callback runs on every poll.
+        training_task_inputs = self._gca_resource.training_task_inputs
+
+        if self._get_backing_custom_job_name() and not self._has_logged_custom_job:
             _LOGGER.info(f"View backing custom job:\n{self._custom_job_console_uri()}")
 
-            if self._gca_resource.training_task_inputs.get("tensorboard"):
+            if training_task_inputs.get("tensorboard"):
                 _LOGGER.info(f"View tensorboard:\n{self._tensorboard_console_uri()}")
 
             self._has_logged_custom_job = True
 
-        if self._gca_resource.training_task_inputs.get(
-            "enable_web_access"
-        ) or self._gca_resource.training_task_inputs.get("enable_dashboard_access"):
+        if training_task_inputs.get("enable_web_access") or training_task_inputs.get(
+            "enable_dashboard_access"
+        ):
             self._log_web_access_uris()
+        elif self._has_logged_custom_job:
+            # The custom job has been logged and web/dashboard access is off,
+            # so there is nothing left to log on later polls.
+            self._callback_is_noop = True
 
     def _custom_job_console_uri(self) -> str:
         """Helper method to compose the dashboard uri where custom job can be viewed."""
-        custom_job_resource_name = self._gca_resource.training_task_metadata.get(
-            "backingCustomJob"
-        )
-        return console_utils.custom_job_console_uri(custom_job_resource_name)
+        return console_utils.custom_job_console_uri(self._get_backing_custom_job_name())
 
     def _tensorboard_console_uri(self) -> str:
         """Helper method to compose dashboard uri where tensorboard can be viewed."""
         tensorboard_resource_name = self._gca_resource.training_task_inputs.get(
             "tensorboard"
         )
-        custom_job_resource_name = self._gca_resource.training_task_metadata.get(
-            "backingCustomJob"
-        )
         return console_utils.custom_job_tensorboard_console_uri(
-            tensorboard_resource_name, custom_job_resource_name
+            tensorboard_resource_name, self._get_backing_custom_job_name()
         )
 
-    @property
+    @functools.cached_property
     def _model_upload_fail_string(self) -> str:
         """Helper property for model upload failure."""
         return (
@@ -1747,6 +1924,102 @@ class _CustomTrainingJob(_TrainingJob):
         )
 
 
+@dataclasses.dataclass(frozen=True)
+class _ForecastingRunSpec:
+    """The arguments a forecasting ``run`` forwards to ``_run``.
+
+    Bundling them into a single frozen object keeps the signature binding done
+    by ``base.optional_sync`` to one argument instead of ~40 keywords per
+    submission. The fields mirror the parameters of
+    ``_ForecastingTrainingJob.run``, which documents them. ``dataset`` is
+    deliberately not part of the spec: it stays an explicit ``_run`` parameter
+    so ``FutureManager`` still finds it when scanning arguments for upstream
+    futures and exceptions.
+    """
+
+    __slots__ = (
+        "target_column",
+        "time_column",
+        "time_series_identifier_column",
+        "unavailable_at_forecast_columns",
+        "available_at_forecast_columns",
+        "forecast_horizon",
+        "data_granularity_unit",
+        "data_granularity_count",
+        "training_fraction_split",
+        "validation_fraction_split",
+        "test_fraction_split",
+        "predefined_split_column_name",
+        "timestamp_split_column_name",
+        "weight_column",
+        "time_series_attribute_columns",
+        "context_window",
+        "export_evaluated_data_items",
+        "export_evaluated_data_items_bigquery_destination_uri",
+        "export_evaluated_data_items_override_destination",
+        "quantiles",
+        "validation_options",
+        "budget_milli_node_hours",
+        "model_display_name",
+        "model_labels",
+        "model_id",
+        "parent_model",
+        "is_default_version",
+        "model_version_aliases",
+        "model_version_description",
+        "hierarchy_group_columns",
+        "hierarchy_group_total_weight",
+        "hierarchy_temporal_total_weight",
+        "hierarchy_group_temporal_total_weight",
+        "window_column",
+        "window_stride_length",
+        "window_max_count",
+        "holiday_regions",
+        "create_request_timeout",
+        "enable_probabilistic_inference",
+    )
+
+    target_column: str
+    time_column: str
+    time_series_identifier_column: str
+    unavailable_at_forecast_columns: List[str]
+    available_at_forecast_columns: List[str]
+    forecast_horizon: int
+    data_granularity_unit: str
+    data_granularity_count: int
+    training_fraction_split: Optional[float]
+    validation_fraction_split: Optional[float]
+    test_fraction_split: Optional[float]
+    predefined_split_column_name: Optional[str]
+    timestamp_split_column_name: Optional[str]
+    weight_column: Optional[str]
+    time_series_attribute_columns: Optional[List[str]]
+    context_window: Optional[int]
+    export_evaluated_data_items: bool
+    export_evaluated_data_items_bigquery_destination_uri: Optional[str]
+    export_evaluated_data_items_override_destination: bool
+    quantiles: Optional[List[float]]
+    validation_options: Optional[str]
+    budget_milli_node_hours: int
+    model_display_name: Optional[str]
+    model_labels: Optional[Dict[str, str]]
+    model_id: Optional[str]
+    parent_model: Optional[str]
+    is_default_version: Optional[bool]
+    model_version_aliases: Optional[Sequence[str]]
+    model_version_description: Optional[str]
+    hierarchy_group_columns: Optional[List[str]]
+    hierarchy_group_total_weight: Optional[float]
+    hierarchy_temporal_total_weight: Optional[float]
+    hierarchy_group_temporal_total_weight: Optional[float]
+    window_column: Optional[str]
+    window_stride_length: Optional[int]
+    window_max_count: Optional[int]
+    holiday_regions: Optional[List[str]]
+    create_request_timeout: Optional[float]
+    enable_probabilistic_inference: bool
+
+
 class _ForecastingTrainingJob(_TrainingJob):
     """ABC for Forecasting Training Pipelines."""
 
@@ -1855,6 +2128,10 @@ class _ForecastingTrainingJob(_TrainingJob):
             model_encryption_spec_key_name=model_encryption_spec_key_name,
         )
 
+        # Deferred import to shave package import time; this helper is only
+        # needed once an AutoML tabular or forecasting job is constructed.
+        from google.cloud.aiplatform.utils import column_transformations_utils
+
         self._column_transformations = (
             column_transformations_utils.validate_and_get_column_transformations(
                 column_specs,
@@ -1863,7 +2140,9 @@ class _ForecastingTrainingJob(_TrainingJob):
         )
 
         self._optimization_objective = optimization_objective
-        self._additional_experiments = []
+        # Dict used as an insertion-ordered set: O(1) membership and removal
+        # while keeping the serialized experiment order deterministic.
+        self._additional_experiments = {}
 
     @property
     @classmethod
@@ -2198,11 +2477,48 @@ class _ForecastingTrainingJob(_TrainingJob):
                 f"{self._model_type} Forecasting Training has already run."
             )
 
+        if data_granularity_unit not in _DATA_GRANULARITY_UNITS:
+            raise ValueError(
+                f"data_granularity_unit `{data_granularity_unit}` invalid. "
+                f"Choose one of {sorted(_DATA_GRANULARITY_UNITS)}."
+            )
+
+        if (
+            data_granularity_unit == "minute"
+            and data_granularity_count not in _MINUTE_DATA_GRANULARITY_COUNTS
+        ):
+            raise ValueError(
+                f"data_granularity_count `{data_granularity_count}` invalid for "
+                "`minute` granularity. Choose one of "
+                f"{sorted(_MINUTE_DATA_GRANULARITY_COUNTS)}."
+            )
+
+        provided_fraction_splits = [
+            fraction
+            for fraction in (
+                training_fraction_split,
+                validation_fraction_split,
+                test_fraction_split,
+            )
+            if fraction is not None
+        ]
+        # Small tolerance so float accumulation cannot reject fractions that
+        # sum to exactly 1.
+        if provided_fraction_splits and (
+            min(provided_fraction_splits) < 0
+            or sum(provided_fraction_splits) > 1 + 1e-9
+        ):
+            raise ValueError(
+                "Fraction splits must each be within [0, 1] and sum to at most "
+                f"1. Got training_fraction_split={training_fraction_split}, "
+                f"validation_fraction_split={validation_fraction_split}, "
+                f"test_fraction_split={test_fraction_split}."
+            )
+
         if additional_experiments:
             self._add_additional_experiments(additional_experiments)
 
-        return self._run(
-            dataset=dataset,
+        spec = _ForecastingRunSpec(
             target_column=target_column,
             time_column=time_column,
             time_series_identifier_column=time_series_identifier_column,
@@ -2240,326 +2556,140 @@ class _ForecastingTrainingJob(_TrainingJob):
             window_stride_length=window_stride_length,
             window_max_count=window_max_count,
             holiday_regions=holiday_regions,
-            sync=sync,
             create_request_timeout=create_request_timeout,
             enable_probabilistic_inference=enable_probabilistic_inference,
         )
 
+        return self._run(dataset, spec, sync=sync)
+
+    @staticmethod
+    def run_many(
+        jobs_with_run_kwargs: Sequence[Tuple["_ForecastingTrainingJob", Dict]],
+    ) -> List[models.Model]:
+        """Submits many forecasting training runs concurrently.
+
+        Every job is submitted with ``sync=False`` so the create RPCs overlap
+        instead of paying the per-call latency serially, then all submissions
+        are waited on together.
+
+        Args:
+            jobs_with_run_kwargs (Sequence[Tuple[_ForecastingTrainingJob, Dict]]):
+                Required. Pairs of a constructed training job and the keyword
+                arguments to pass to its ``run`` method.
+
+        Returns:
+            List[models.Model]: The trained models, in submission order.
+        """
+        model_futures = [
+            job.run(**{**run_kwargs, "sync": False})
+            for job, run_kwargs in jobs_with_run_kwargs
+        ]
+        for model in model_futures:
+            model.wait()
+        return model_futures
+
     @base.optional_sync()
     def _run(
         self,
         dataset: datasets.TimeSeriesDataset,
-        target_column: str,
-        time_column: str,
-        time_series_identifier_column: str,
-        unavailable_at_forecast_columns: List[str],
-        available_at_forecast_columns: List[str],
-        forecast_horizon: int,
-        data_granularity_unit: str,
-        data_granularity_count: int,
-        training_fraction_split: Optional[float] = None,
-        validation_fraction_split: Optional[float] = None,
-        test_fraction_split: Optional[float] = None,
-        predefined_split_column_name: Optional[str] = None,
-        timestamp_split_column_name: Optional[str] = None,
-        weight_column: Optional[str] = None,
-        time_series_attribute_columns: Optional[List[str]] = None,
-        context_window: Optional[int] = None,
-        export_evaluated_data_items: bool = False,
-        export_evaluated_data_items_bigquery_destination_uri: Optional[str] = None,
-        export_evaluated_data_items_override_destination: bool = False,
-        quantiles: Optional[List[float]] = None,
-        validation_options: Optional[str] = None,
-        budget_milli_node_hours: int = 1000,
-        model_display_name: Optional[str] = None,
-        model_labels: Optional[Dict[str, str]] = None,
-        model_id: Optional[str] = None,
-        parent_model: Optional[str] = None,
-        is_default_version: Optional[bool] = True,
-        model_version_aliases: Optional[Sequence[str]] = None,
-        model_version_description: Optional[str] = None,
-        hierarchy_group_columns: Optional[List[str]] = None,
-        hierarchy_group_total_weight: Optional[float] = None,
-        hierarchy_temporal_total_weight: Optional[float] = None,
-        hierarchy_group_temporal_total_weight: Optional[float] = None,
-        window_column: Optional[str] = None,
-        window_stride_length: Optional[int] = None,
-        window_max_count: Optional[int] = None,
-        holiday_regions: Optional[List[str]] = None,
+        spec: "_ForecastingRunSpec",
         sync: bool = True,
-        create_request_timeout: Optional[float] = None,
-        enable_probabilistic_inference: bool = False,
     ) -> models.Model:
         """Runs the training job and returns a model.
 
-        If training on a Vertex AI dataset, you can use one of the following split configurations:
-            Data fraction splits:
-            Any of ``training_fraction_split``, ``validation_fraction_split`` and
-            ``test_fraction_split`` may optionally be provided, they must sum to up to 1. If
-            the provided ones sum to less than 1, the remainder is assigned to sets as
-            decided by Vertex AI. If none of the fractions are set, by default roughly 80%
-            of data will be used for training, 10% for validation, and 10% for test.
-
-            Predefined splits:
-            Assigns input data to training, validation, and test sets based on the value of a provided key.
-            If using predefined splits, ``predefined_split_column_name`` must be provided.
-            Supported only for tabular Datasets.
-
-            Timestamp splits:
-            Assigns input data to training, validation, and test sets
-            based on a provided timestamps. The youngest data pieces are
-            assigned to training set, next to validation set, and the oldest
-            to the test set.
-            Supported only for tabular Datasets.
-
         Args:
             dataset (datasets.TimeSeriesDataset):
-                Required. The dataset within the same Project from which data will be used to train the Model. The
-                Dataset must use schema compatible with Model being trained,
-                and what is compatible should be described in the used
-                TrainingPipeline's [training_task_definition]
-                [google.cloud.aiplatform.v1beta1.TrainingPipeline.training_task_definition].
-                For time series Datasets, all their data is exported to
-                training, to pick and choose from.
-            target_column (str):
-                Required. Name of the column that the Model is to predict values for. This
-                column must be unavailable at forecast.
-            time_column (str):
-                Required. Name of the column that identifies time order in the time series.
-                This column must be available at forecast.
-            time_series_identifier_column (str):
-                Required. Name of the column that identifies the time series.
-            unavailable_at_forecast_columns (List[str]):
-                Required. Column names of columns that are unavailable at forecast.
-                Each column contains information for the given entity (identified by the
-                [time_series_identifier_column]) that is unknown before the forecast
-                (e.g. population of a city in a given year, or weather on a given day).
-            available_at_forecast_columns (List[str]):
-                Required. Column names of columns that are available at forecast.
-                Each column contains information for the given entity (identified by the
-                [time_series_identifier_column]) that is known at forecast.
-            forecast_horizon: (int):
-                Required. The amount of time into the future for which forecasted values for the target are
-                returned. Expressed in number of units defined by the [data_granularity_unit] and
-                [data_granularity_count] field. Inclusive.
-            data_granularity_unit (str):
-                Required. The data granularity unit. Accepted values are ``minute``,
-                ``hour``, ``day``, ``week``, ``month``, ``year``.
-            data_granularity_count (int):
-                Required. The number of data granularity units between data points in the training
-                data. If [data_granularity_unit] is `minute`, can be 1, 5, 10, 15, or 30. For all other
-                values of [data_granularity_unit], must be 1.
-            training_fraction_split (float):
-                Optional. The fraction of the input data that is to be used to train
-                the Model. This is ignored if Dataset is not provided.
-            validation_fraction_split (float):
-                Optional. The fraction of the input data that is to be used to validate
-                the Model. This is ignored if Dataset is not provided.
-            test_fraction_split (float):
-                Optional. The fraction of the input data that is to be used to evaluate
-                the Model. This is ignored if Dataset is not provided.
-            predefined_split_column_name (str):
-                Optional. The key is a name of one of the Dataset's data
-                columns. The value of the key (either the label's value or
-                value in the column) must be one of {``training``,
-                ``validation``, ``test``}, and it defines to which set the
-                given piece of data is assigned. If for a piece of data the
-                key is not present or has an invalid value, that piece is
-                ignored by the pipeline.
-
-                Supported only for tabular and time series Datasets.
-            timestamp_split_column_name (str):
-                Optional. The key is a name of one of the Dataset's data
-                columns. The value of the key values of the key (the values in
-                the column) must be in RFC 3339 `date-time` format, where
-                `time-offset` = `"Z"` (e.g. 1985-04-12T23:20:50.52Z). If for a
-                piece of data the key is not present or has an invalid value,
-                that piece is ignored by the pipeline.
-                Supported only for tabular and time series Datasets.
-                This parameter must be used with training_fraction_split,
-                validation_fraction_split, and test_fraction_split.
-            weight_column (str):
-                Optional. Name of the column that should be used as the weight column.
-                Higher values in this column give more importance to the row
-                during Model training. The column must have numeric values between 0 and
-                10000 inclusively, and 0 value means that the row is ignored.
-                If the weight column field is not set, then all rows are assumed to have
-                equal weight of 1.
-            time_series_attribute_columns (List[str]):
-                Optional. Column names that should be used as attribute columns.
-                Each column is constant within a time series.
-            context_window (int):
-                Optional. The amount of time into the past training and prediction data is used for
-                model training and prediction respectively. Expressed in number of units defined by the
-                [data_granularity_unit] and [data_granularity_count] fields. When not provided uses the
-                default value of 0 which means the model sets each series context window to be 0 (also
-                known as "cold start"). Inclusive.
-            export_evaluated_data_items (bool):
-                Whether to export the test set predictions to a BigQuery table.
-                If False, then the export is not performed.
-            export_evaluated_data_items_bigquery_destination_uri (string):
-                Optional. URI of desired destination BigQuery table for exported test set predictions.
-
-                Expected format:
-                ``bq://<project_id>:<dataset_id>:<table>``
-
-                If not specified, then results are exported to the following auto-created BigQuery
-                table:
-                ``<project_id>:export_evaluated_examples_<model_name>_<yyyy_MM_dd'T'HH_mm_ss_SSS'Z'>.evaluated_examples``
-
-                Applies only if [export_evaluated_data_items] is True.
-            export_evaluated_data_items_override_destination (bool):
-                Whether to override the contents of [export_evaluated_data_items_bigquery_destination_uri],
-                if the table exists, for exported test set predictions. If False, and the
-                table exists, then the training job will fail.
-
-                Applies only if [export_evaluated_data_items] is True and
-                [export_evaluated_data_items_bigquery_destination_uri] is specified.
-            quantiles (List[float]):
-                Quantiles to use for the `minimize-quantile-loss`
-                [AutoMLForecastingTrainingJob.optimization_objective]. This
-                argument is required in this case. Quantiles may also optionally
-                be used if probabilistic inference is enabled.
-
-                Accepts up to 5 quantiles in the form of a double from 0 to 1,
-                exclusive. Each quantile must be unique.
-            validation_options (str):
-                Validation options for the data validation component. The available options are:
-                "fail-pipeline" - (default), will validate against the validation and fail the pipeline
-                                  if it fails.
-                "ignore-validation" - ignore the results of the validation and continue the pipeline
-            budget_milli_node_hours (int):
-                Optional. The train budget of creating this Model, expressed in milli node
-                hours i.e. 1,000 value in this field means 1 node hour.
-                The training cost of the model will not exceed this budget. The final
-                cost will be attempted to be close to the budget, though may end up
-                being (even) noticeably smaller - at the backend's discretion. This
-                especially may happen when further model training ceases to provide
-                any improvements.
-                If the budget is set to a value known to be insufficient to train a
-                Model for the given training set, the training won't be attempted and
-                will error.
-                The minimum value is 1000 and the maximum is 72000.
-            model_display_name (str):
-                Optional. If the script produces a managed Vertex AI Model. The display name of
-                the Model. The name can be up to 128 characters long and can be consist
-                of any UTF-8 characters.
-
-                If not provided upon creation, the job's display_name is used.
-            model_labels (Dict[str, str]):
-                Optional. The labels with user-defined metadata to
-                organize your Models.
-                Label keys and values can be no longer than 64
-                characters (Unicode codepoints), can only
-                contain lowercase letters, numeric characters,
-                underscores and dashes. International characters
-                are allowed.
-                See https://goo.gl/xmQnxf for more information
-                and examples of labels.
-            model_id (str):
-                Optional. The ID to use for the Model produced by this job,
-                which will become the final component of the model resource name.
-                This value may be up to 63 characters, and valid characters
-                are `[a-z0-9_-]`. The first character cannot be a number or hyphen.
-            parent_model (str):
-                Optional. The resource name or model ID of an existing model.
-                The new model uploaded by this job will be a version of `parent_model`.
-
-                Only set this field when training a new version of an existing model.
-            is_default_version (bool):
-                Optional. When set to True, the newly uploaded model version will
-                automatically have alias "default" included. Subsequent uses of
-                the model produced by this job without a version specified will
-                use this "default" version.
-
-                When set to False, the "default" alias will not be moved.
-                Actions targeting the model version produced by this job will need
-                to specifically reference this version by ID or alias.
-
-                New model uploads, i.e. version 1, will always be "default" aliased.
-            model_version_aliases (Sequence[str]):
-                Optional. User provided version aliases so that the model version
-                uploaded by this job can be referenced via alias instead of
-                auto-generated version ID. A default version alias will be created
-                for the first version of the model.
-
-                The format is [a-z][a-zA-Z0-9-]{0,126}[a-z0-9]
-            model_version_description (str):
-               Optional. The description of the model version being uploaded by this job.
-            hierarchy_group_columns (List[str]):
-                Optional. A list of time series attribute column names that
-                define the time series hierarchy. Only one level of hierarchy is
-                supported, ex. ``region`` for a hierarchy of stores or
-                ``department`` for a hierarchy of products. If multiple columns
-                are specified, time series will be grouped by their combined
-                values, ex. (``blue``, ``large``) for ``color`` and ``size``, up
-                to 5 columns are accepted. If no group columns are specified,
-                all time series are considered to be part of the same group.
-            hierarchy_group_total_weight (float):
-                Optional. The weight of the loss for predictions aggregated over
-                time series in the same hierarchy group.
-            hierarchy_temporal_total_weight (float):
-                Optional. The weight of the loss for predictions aggregated over
-                the horizon for a single time series.
-            hierarchy_group_temporal_total_weight (float):
-                Optional. The weight of the loss for predictions aggregated over
-                both the horizon and time series in the same hierarchy group.
-            window_column (str):
-                Optional. Name of the column that should be used to filter input
-                rows. The column should contain either booleans or string
-                booleans; if the value of the row is True, generate a sliding
-                window from that row.
-            window_stride_length (int):
-                Optional. Step length used to generate input examples. Every
-                ``window_stride_length`` rows will be used to generate a sliding
-                window.
-            window_max_count (int):
-                Optional. Number of rows that should be used to generate input
-                examples. If the total row count is larger than this number, the
-                input data will be randomly sampled to hit the count.
-            holiday_regions (List[str]):
-                Optional. The geographical regions to use when creating holiday
-                features. This option is only allowed when data_granularity_unit
-                is ``day``. Acceptable values can come from any of the following
-                levels:
-                  Top level: GLOBAL
-                  Second level: continental regions
-                    NA: North America
-                    JAPAC: Japan and Asia Pacific
-                    EMEA: Europe, the Middle East and Africa
-                    LAC: Latin America and the Caribbean
-                  Third level: countries from ISO 3166-1 Country codes.
+                Required. The dataset within the same Project from which data
+                will be used to train the Model. Passed outside of ``spec`` so
+                dependency tracking can wait on its pending creation.
+            spec (_ForecastingRunSpec):
+                Required. The remaining run arguments, bundled into a single
+                object by ``run``, which documents every field.
             sync (bool):
                 Whether to execute this method synchronously. If False, this method
                 will be executed in concurrent Future and any downstream object will
                 be immediately returned and synced when the Future has completed.
-            create_request_timeout (float):
-                Optional. The timeout for the create request in seconds.
-            enable_probabilistic_inference (bool):
-                If probabilistic inference is enabled, the model will fit a
-                distribution that captures the uncertainty of a prediction. At
-                inference time, the predictive distribution is used to make a
-                point prediction that minimizes the optimization objective. For
-                example, the mean of a predictive distribution is the point
-                prediction that minimizes RMSE loss. If quantiles are specified,
-                then the quantiles of the distribution are also returned. The
-                optimization objective cannot be minimize-quantile-loss.
+
         Returns:
             model: The trained Vertex AI Model resource or None if training did not
                 produce a Vertex AI Model.
         """
+        target_column = spec.target_column
+        time_column = spec.time_column
+        time_series_identifier_column = spec.time_series_identifier_column
+        unavailable_at_forecast_columns = spec.unavailable_at_forecast_columns
+        available_at_forecast_columns = spec.available_at_forecast_columns
+        forecast_horizon = spec.forecast_horizon
+        data_granularity_unit = spec.data_granularity_unit
+        data_granularity_count = spec.data_granularity_count
+        training_fraction_split = spec.training_fraction_split
+        validation_fraction_split = spec.validation_fraction_split
+        test_fraction_split = spec.test_fraction_split
+        predefined_split_column_name = spec.predefined_split_column_name
+        timestamp_split_column_name = spec.timestamp_split_column_name
+        weight_column = spec.weight_column
+        time_series_attribute_columns = spec.time_series_attribute_columns
+        context_window = spec.context_window
+        export_evaluated_data_items = spec.export_evaluated_data_items
+        export_evaluated_data_items_bigquery_destination_uri = (
+            spec.export_evaluated_data_items_bigquery_destination_uri
+        )
+        export_evaluated_data_items_override_destination = (
+            spec.export_evaluated_data_items_override_destination
+        )
+        quantiles = spec.quantiles
+        validation_options = spec.validation_options
+        budget_milli_node_hours = spec.budget_milli_node_hours
+        model_display_name = spec.model_display_name
+        model_labels = spec.model_labels
+        model_id = spec.model_id
+        parent_model = spec.parent_model
+        is_default_version = spec.is_default_version
+        model_version_aliases = spec.model_version_aliases
+        model_version_description = spec.model_version_description
+        hierarchy_group_columns = spec.hierarchy_group_columns
+        hierarchy_group_total_weight = spec.hierarchy_group_total_weight
+        hierarchy_temporal_total_weight = spec.hierarchy_temporal_total_weight
+        hierarchy_group_temporal_total_weight = (
+            spec.hierarchy_group_temporal_total_weight
+        )
+        window_column = spec.window_column
+        window_stride_length = spec.window_stride_length
+        window_max_count = spec.window_max_count
+        holiday_regions = spec.holiday_regions
+        create_request_timeout = spec.create_request_timeout
+        enable_probabilistic_inference = spec.enable_probabilistic_inference
+
         # auto-populate transformations
         if self._column_transformations is None:
             _LOGGER.info(
                 "No column transformations provided, so now retrieving columns from dataset in order to set default column transformations."
             )
 
-            (
-                self._column_transformations,
-                column_names,
-            ) = column_transformations_utils.get_default_column_transformations(
-                dataset=dataset, target_column=target_column
+            cache_key = (getattr(dataset, "resource_name", None), target_column)
+            cached_transformations = (
+                _default_column_transformations_cache.get(cache_key)
+                if cache_key[0]
+                else None
             )
+            if cached_transformations is not None:
+                self._column_transformations, column_names = cached_transformations
+            else:
+                from google.cloud.aiplatform.utils import (
+                    column_transformations_utils,
+                )
+
+                (
+                    self._column_transformations,
+                    column_names,
+                ) = column_transformations_utils.get_default_column_transformations(
+                    dataset=dataset, target_column=target_column
+                )
+                if cache_key[0]:
+                    _default_column_transformations_cache[cache_key] = (
+                        self._column_transformations,
+                        column_names,
+                    )
 
             _LOGGER.info(
                 "The column transformation of type 'auto' was set for the following columns: %s."
@@ -2585,38 +2715,43 @@ class _ForecastingTrainingJob(_TrainingJob):
                 additional_experiment_probabilistic_inference
             )
 
+        optional_values = (
+            time_series_attribute_columns,
+            weight_column,
+            context_window,
+            quantiles,
+            validation_options,
+            self._optimization_objective,
+            holiday_regions,
+        )
         training_task_inputs_dict = {
             # required inputs
-            "targetColumn": target_column,
-            "timeColumn": time_column,
-            "timeSeriesIdentifierColumn": time_series_identifier_column,
-            "timeSeriesAttributeColumns": time_series_attribute_columns,
-            "unavailableAtForecastColumns": unavailable_at_forecast_columns,
-            "availableAtForecastColumns": available_at_forecast_columns,
-            "forecastHorizon": forecast_horizon,
-            "dataGranularity": {
+            _TARGET_COLUMN_KEY: target_column,
+            _TIME_COLUMN_KEY: time_column,
+            _TIME_SERIES_IDENTIFIER_COLUMN_KEY: time_series_identifier_column,
+            _UNAVAILABLE_AT_FORECAST_COLUMNS_KEY: unavailable_at_forecast_columns,
+            _AVAILABLE_AT_FORECAST_COLUMNS_KEY: available_at_forecast_columns,
+            _FORECAST_HORIZON_KEY: forecast_horizon,
+            _DATA_GRANULARITY_KEY: {
                 "unit": data_granularity_unit,
                 "quantity": data_granularity_count,
             },
-            "transformations": self._column_transformations,
-            "trainBudgetMilliNodeHours": budget_milli_node_hours,
-            # optional inputs
-            "weightColumn": weight_column,
-            "contextWindow": context_window,
-            "quantiles": quantiles,
-            "validationOptions": validation_options,
-            "optimizationObjective": self._optimization_objective,
-            "holidayRegions": holiday_regions,
+            _TRANSFORMATIONS_KEY: self._column_transformations,
+            _TRAIN_BUDGET_MILLI_NODE_HOURS_KEY: budget_milli_node_hours,
+            # optional inputs, omitted instead of serialized as nulls
+            **{
+                key: value
+                for key, value in zip(_OPTIONAL_FORECASTING_INPUT_KEYS, optional_values)
+                if value is not None
+            },
         }
 
         # TODO(TheMichaelHu): Remove the ifs once the API supports these inputs.
-        if any(
-            [
-                hierarchy_group_columns,
-                hierarchy_group_total_weight,
-                hierarchy_temporal_total_weight,
-                hierarchy_group_temporal_total_weight,
-            ]
+        if (
+            hierarchy_group_columns
+            or hierarchy_group_total_weight
+            or hierarchy_temporal_total_weight
+            or hierarchy_group_temporal_total_weight
         ):
             training_task_inputs_dict["hierarchyConfig"] = {
                 "groupColumns": hierarchy_group_columns,
@@ -2636,7 +2771,7 @@ class _ForecastingTrainingJob(_TrainingJob):
         if final_export_eval_bq_uri and not final_export_eval_bq_uri.startswith(
             "bq://"
         ):
-            final_export_eval_bq_uri = f"bq://{final_export_eval_bq_uri}"
+            final_export_eval_bq_uri = "bq://" + final_export_eval_bq_uri
 
         if export_evaluated_data_items:
             training_task_inputs_dict["exportEvaluatedDataItemsConfig"] = {
@@ -2645,19 +2780,27 @@ class _ForecastingTrainingJob(_TrainingJob):
             }
 
         if self._additional_experiments:
-            training_task_inputs_dict[
-                "additionalExperiments"
-            ] = self._additional_experiments
+            training_task_inputs_dict["additionalExperiments"] = list(
+                self._additional_experiments
+            )
 
-        model = gca_model.Model(
-            display_name=model_display_name or self._display_name,
-            labels=model_labels or self._labels,
-            encryption_spec=self._model_encryption_spec,
+        model_kwargs = {"display_name": model_display_name or self._display_name}
+        model_labels = model_labels or self._labels
+        if model_labels:
+            model_kwargs["labels"] = model_labels
+        if self._model_encryption_spec:
+            model_kwargs["encryption_spec"] = self._model_encryption_spec
+        model = gca_model.Model(**model_kwargs)
+
+        # Convert once through the C-accelerated ParseDict rather than letting
+        # proto-plus marshal the nested dict key by key in Python.
+        training_task_inputs = json_format.ParseDict(
+            training_task_inputs_dict, struct_pb2.Value()
         )
 
         new_model = self._run_job(
             training_task_definition=self._training_task_definition,
-            training_task_inputs=training_task_inputs_dict,
+            training_task_inputs=training_task_inputs,
             dataset=dataset,
             training_fraction_split=training_fraction_split,
             validation_fraction_split=validation_fraction_split,
@@ -2681,7 +2824,7 @@ class _ForecastingTrainingJob(_TrainingJob):
 
         return new_model
 
-    @property
+    @functools.cached_property
     def _model_upload_fail_string(self) -> str:
         """Helper property for model upload failure."""
         return (
@@ -2698,11 +2841,21 @@ class _ForecastingTrainingJob(_TrainingJob):
             None: If the export feature was not enabled for training.
         """
 
+        cached_uri = getattr(self, "_cached_evaluated_data_items_bigquery_uri", None)
+        if cached_uri is not None:
+            return cached_uri
+
         self._assert_gca_resource_is_available()
 
         metadata = self._gca_resource.training_task_metadata
         if metadata and "evaluatedDataItemsBigqueryUri" in metadata:
-            return metadata["evaluatedDataItemsBigqueryUri"]
+            uri = metadata["evaluatedDataItemsBigqueryUri"]
+            # training_task_metadata is immutable once the pipeline reaches a
+            # terminal state, so the uri can be served from cache on later
+            # polls without re-reading the proto.
+            if self._gca_resource.state in _PIPELINE_COMPLETE_STATES:
+                self._cached_evaluated_data_items_bigquery_uri = uri
+            return uri
 
         return None
 
@@ -2712,15 +2865,14 @@ class _ForecastingTrainingJob(_TrainingJob):
             additional_experiments (List[str]):
                 Experiment flags that can enable some experimental training features.
         """
-        self._additional_experiments.extend(additional_experiments)
+        self._additional_experiments.update(dict.fromkeys(additional_experiments))
 
     def _convert_enable_probabilistic_inference(self) -> bool:
         """Convert enable probabilistic from additional experiments."""
         key = "enable_probabilistic_inference"
-        if self._additional_experiments:
-            if key in self._additional_experiments:
-                self._additional_experiments.remove(key)
-                return True
+        if key in self._additional_experiments:
+            del self._additional_experiments[key]
+            return True
         return False
 
     @staticmethod
@@ -2730,14 +2882,17 @@ class _ForecastingTrainingJob(_TrainingJob):
         max_count: Optional[int] = None,
     ) -> Optional[Dict[str, Union[int, str]]]:
         """Creates a window config from training job arguments."""
-        configs = {
-            "column": column,
-            "strideLength": stride_length,
-            "maxCount": max_count,
-        }
-        present_configs = {k: v for k, v in configs.items() if v is not None}
-        if not present_configs:
+        if column is None and stride_length is None and max_count is None:
             return None
+        present_configs = {
+            key: value
+            for key, value in (
+                ("column", column),
+                ("strideLength", stride_length),
+                ("maxCount", max_count),
+            )
+            if value is not None
+        }
         if len(present_configs) > 1:
             raise ValueError(
                 "More than one windowing strategy provided. Make sure only one "
@@ -3438,8 +3593,15 @@ class CustomTrainingJob(_CustomTrainingJob):
             The trained Vertex AI model resource or None if the training
             job didn't create a model.
         """
-        network = network or initializer.global_config.network
-        service_account = service_account or initializer.global_config.service_account
+        global_config = initializer.global_config
+        network = network or global_config.network
+        service_account = service_account or global_config.service_account
+
+        _validate_environment_variables(environment_variables)
+
+        # The reduction server container is only used when replicas are requested.
+        if reduction_server_replica_count <= 0:
+            reduction_server_container_uri = None
 
         worker_pool_specs, managed_model = self._prepare_and_validate_run(
             model_display_name=model_display_name,
@@ -3493,11 +3655,7 @@ class CustomTrainingJob(_CustomTrainingJob):
             enable_web_access=enable_web_access,
             enable_dashboard_access=enable_dashboard_access,
             tensorboard=tensorboard,
-            reduction_server_container_uri=(
-                reduction_server_container_uri
-                if reduction_server_replica_count > 0
-                else None
-            ),
+            reduction_server_container_uri=reduction_server_container_uri,
             sync=sync,
             create_request_timeout=create_request_timeout,
             disable_retries=disable_retries,
@@ -3894,6 +4052,12 @@ class CustomTrainingJob(_CustomTrainingJob):
         """
         network = network or initializer.global_config.network
 
+        _validate_environment_variables(environment_variables)
+
+        # The reduction server container is only used when replicas are requested.
+        if reduction_server_replica_count <= 0:
+            reduction_server_container_uri = None
+
         worker_pool_specs, managed_model = self._prepare_and_validate_run(
             model_display_name=model_display_name,
             model_labels=model_labels,
@@ -3946,11 +4110,7 @@ class CustomTrainingJob(_CustomTrainingJob):
             enable_web_access=enable_web_access,
             enable_dashboard_access=enable_dashboard_access,
             tensorboard=tensorboard,
-            reduction_server_container_uri=(
-                reduction_server_container_uri
-                if reduction_server_replica_count > 0
-                else None
-            ),
+            reduction_server_container_uri=reduction_server_container_uri,
             sync=sync,
             create_request_timeout=create_request_timeout,
             block=False,
@@ -3960,6 +4120,35 @@ class CustomTrainingJob(_CustomTrainingJob):
             max_wait_duration=max_wait_duration,
         )
 
+    @staticmethod
+    def submit_many(
+        jobs_with_submit_kwargs: Sequence[Tuple["CustomTrainingJob", Dict]],
+    ) -> List[models.Model]:
+        """Submits many custom training jobs concurrently.
+
+        Every job is submitted with ``sync=False`` so packaging and the create
+        RPCs overlap in the SDK's thread pool instead of serializing on the
+        caller, then all submissions are waited on until their pipelines are
+        created. Training itself is not waited on.
+
+        Args:
+            jobs_with_submit_kwargs (Sequence[Tuple[CustomTrainingJob, Dict]]):
+                Required. Pairs of a constructed training job and the keyword
+                arguments to pass to its ``submit`` method.
+
+        Returns:
+            List[models.Model]: The model futures, in submission order. An
+                entry is None when its job is not configured to upload a
+                managed model, matching what ``submit`` returns for such jobs.
+        """
+        model_futures = [
+            job.submit(**{**submit_kwargs, "sync": False})
+            for job, submit_kwargs in jobs_with_submit_kwargs
+        ]
+        for job, _ in jobs_with_submit_kwargs:
+            job.wait_for_resource_creation()
+        return model_futures
+
     @base.optional_sync(construct_object_on_arg="managed_model")
     def _run(
         self,
@@ -4225,10 +4414,7 @@ class CustomTrainingJob(_CustomTrainingJob):
             if not spec:
                 continue
 
-            if (
-                spec_order == worker_spec_utils._SPEC_ORDERS["server_spec"]
-                and reduction_server_container_uri
-            ):
+            if spec_order == _SERVER_SPEC_ORDER and reduction_server_container_uri:
                 spec["container_spec"] = {
                     "image_uri": reduction_server_container_uri,
                 }
@@ -4268,7 +4454,7 @@ class CustomTrainingJob(_CustomTrainingJob):
         )
 
         model = self._run_job(
-            training_task_definition=schema.training_job.definition.custom_task,
+            training_task_definition=_CUSTOM_TASK_DEFINITION,
             training_task_inputs=training_task_inputs,
             dataset=dataset,
             annotation_schema_uri=annotation_schema_uri,
@@ -4922,8 +5108,15 @@ class CustomContainerTrainingJob(_CustomTrainingJob):
                 been set, or model_display_name was provided but required arguments
                 were not provided in constructor.
         """
-        network = network or initializer.global_config.network
-        service_account = service_account or initializer.global_config.service_account
+        global_config = initializer.global_config
+        network = network or global_config.network
+        service_account = service_account or global_config.service_account
+
+        _validate_environment_variables(environment_variables)
+
+        # The reduction server container is only used when replicas are requested.
+        if reduction_server_replica_count <= 0:
+            reduction_server_container_uri = None
 
         worker_pool_specs, managed_model = self._prepare_and_validate_run(
             model_display_name=model_display_name,
@@ -4971,11 +5164,7 @@ class CustomContainerTrainingJob(_CustomTrainingJob):
             enable_web_access=enable_web_access,
             enable_dashboard_access=enable_dashboard_access,
             tensorboard=tensorboard,
-            reduction_server_container_uri=(
-                reduction_server_container_uri
-                if reduction_server_replica_count > 0
-                else None
-            ),
+            reduction_server_container_uri=reduction_server_container_uri,
             sync=sync,
             create_request_timeout=create_request_timeout,
             disable_retries=disable_retries,
@@ -5370,6 +5559,12 @@ class CustomContainerTrainingJob(_CustomTrainingJob):
         """
         network = network or initializer.global_config.network
 
+        _validate_environment_variables(environment_variables)
+
+        # The reduction server container is only used when replicas are requested.
+        if reduction_server_replica_count <= 0:
+            reduction_server_container_uri = None
+
         worker_pool_specs, managed_model = self._prepare_and_validate_run(
             model_display_name=model_display_name,
             model_labels=model_labels,
@@ -5416,11 +5611,7 @@ class CustomContainerTrainingJob(_CustomTrainingJob):
             enable_web_access=enable_web_access,
             enable_dashboard_access=enable_dashboard_access,
             tensorboard=tensorboard,
-            reduction_server_container_uri=(
-                reduction_server_container_uri
-                if reduction_server_replica_count > 0
-                else None
-            ),
+            reduction_server_container_uri=reduction_server_container_uri,
             sync=sync,
             create_request_timeout=create_request_timeout,
             block=False,
@@ -5680,32 +5871,33 @@ class CustomContainerTrainingJob(_CustomTrainingJob):
                 produce a Vertex AI Model.
         """
 
+        # Resolved once so the loop below does not re-branch per pool or
+        # rebuild the identical container spec and env translation per pool.
+        server_spec_order = (
+            _SERVER_SPEC_ORDER if reduction_server_container_uri else None
+        )
+        container_spec = {"imageUri": self._container_uri}
+        if self._command:
+            container_spec["command"] = self._command
+        if args:
+            container_spec["args"] = args
+        if environment_variables:
+            container_spec["env"] = [
+                {"name": key, "value": value}
+                for key, value in environment_variables.items()
+            ]
+
         for spec_order, spec in enumerate(worker_pool_specs):
 
             if not spec:
                 continue
 
-            if (
-                spec_order == worker_spec_utils._SPEC_ORDERS["server_spec"]
-                and reduction_server_container_uri
-            ):
+            if spec_order == server_spec_order:
                 spec["container_spec"] = {
                     "image_uri": reduction_server_container_uri,
                 }
             else:
-                spec["containerSpec"] = {"imageUri": self._container_uri}
-
-                if self._command:
-                    spec["containerSpec"]["command"] = self._command
-
-                if args:
-                    spec["containerSpec"]["args"] = args
-
-                if environment_variables:
-                    spec["containerSpec"]["env"] = [
-                        {"name": key, "value": value}
-                        for key, value in environment_variables.items()
-                    ]
+                spec["containerSpec"] = dict(container_spec)
 
         (
             training_task_inputs,
@@ -5727,7 +5919,7 @@ class CustomContainerTrainingJob(_CustomTrainingJob):
         )
 
         model = self._run_job(
-            training_task_definition=schema.training_job.definition.custom_task,
+            training_task_definition=_CUSTOM_TASK_DEFINITION,
             training_task_inputs=training_task_inputs,
             dataset=dataset,
             annotation_schema_uri=annotation_schema_uri,
@@ -5925,6 +6117,10 @@ class AutoMLTabularTrainingJob(_TrainingJob):
             model_encryption_spec_key_name=model_encryption_spec_key_name,
         )
 
+        # Deferred import to shave package import time; this helper is only
+        # needed once an AutoML tabular or forecasting job is constructed.
+        from google.cloud.aiplatform.utils import column_transformations_utils
+
         self._column_transformations = (
             column_transformations_utils.validate_and_get_column_transformations(
                 column_specs, column_transformations
@@ -6374,6 +6570,8 @@ class AutoMLTabularTrainingJob(_TrainingJob):
                 "No column transformations provided, so now retrieving columns from dataset in order to set default column transformations."
             )
 
+            from google.cloud.aiplatform.utils import column_transformations_utils
+
             (
                 self._column_transformations,
                 column_names,
@@ -6404,7 +6602,7 @@ class AutoMLTabularTrainingJob(_TrainingJob):
         if final_export_eval_bq_uri and not final_export_eval_bq_uri.startswith(
             "bq://"
         ):
-            final_export_eval_bq_uri = f"bq://{final_export_eval_bq_uri}"
+            final_export_eval_bq_uri = "bq://" + final_export_eval_bq_uri
 
         if export_evaluated_data_items:
             training_task_inputs_dict["exportEvaluatedDataItemsConfig"] = {
@@ -6441,7 +6639,7 @@ class AutoMLTabularTrainingJob(_TrainingJob):
             create_request_timeout=create_request_timeout,
         )
 
-    @property
+    @functools.cached_property
     def _model_upload_fail_string(self) -> str:
         """Helper property for model upload failure."""
         return (
@@ -7410,7 +7608,7 @@ class AutoMLImageTrainingJob(_TrainingJob):
             create_request_timeout=create_request_timeout,
         )
 
-    @property
+    @functools.cached_property
     def _model_upload_fail_string(self) -> str:
         """Helper property for model upload failure."""
         return (
@@ -8077,8 +8275,15 @@ class CustomPythonPackageTrainingJob(_CustomTrainingJob):
             model: The trained Vertex AI Model resource or None if training did not
                 produce a Vertex AI Model.
         """
-        network = network or initializer.global_config.network
-        service_account = service_account or initializer.global_config.service_account
+        global_config = initializer.global_config
+        network = network or global_config.network
+        service_account = service_account or global_config.service_account
+
+        _validate_environment_variables(environment_variables)
+
+        # The reduction server container is only used when replicas are requested.
+        if reduction_server_replica_count <= 0:
+            reduction_server_container_uri = None
 
         worker_pool_specs, managed_model = self._prepare_and_validate_run(
             model_display_name=model_display_name,
@@ -8126,11 +8331,7 @@ class CustomPythonPackageTrainingJob(_CustomTrainingJob):
             enable_web_access=enable_web_access,
             enable_dashboard_access=enable_dashboard_access,
             tensorboard=tensorboard,
-            reduction_server_container_uri=(
-                reduction_server_container_uri
-                if reduction_server_replica_count > 0
-                else None
-            ),
+            reduction_server_container_uri=reduction_server_container_uri,
             sync=sync,
             create_request_timeout=create_request_timeout,
             disable_retries=disable_retries,
@@ -8372,33 +8573,35 @@ class CustomPythonPackageTrainingJob(_CustomTrainingJob):
             model: The trained Vertex AI Model resource or None if training did not
                 produce a Vertex AI Model.
         """
+        # Resolved once so the loop below does not re-branch per pool; the
+        # reduction-server path is skipped entirely when no uri is set.
+        server_spec_order = (
+            _SERVER_SPEC_ORDER if reduction_server_container_uri else None
+        )
+        python_package_spec = {
+            "executor_image_uri": self._container_uri,
+            "python_module": self._python_module,
+            "package_uris": self._package_gcs_uri,
+        }
+        if args:
+            python_package_spec["args"] = args
+        if environment_variables:
+            python_package_spec["env"] = [
+                {"name": key, "value": value}
+                for key, value in environment_variables.items()
+            ]
+
         for spec_order, spec in enumerate(worker_pool_specs):
 
             if not spec:
                 continue
 
-            if (
-                spec_order == worker_spec_utils._SPEC_ORDERS["server_spec"]
-                and reduction_server_container_uri
-            ):
+            if spec_order == server_spec_order:
                 spec["container_spec"] = {
                     "image_uri": reduction_server_container_uri,
                 }
             else:
-                spec["python_package_spec"] = {
-                    "executor_image_uri": self._container_uri,
-                    "python_module": self._python_module,
-                    "package_uris": self._package_gcs_uri,
-                }
-
-                if args:
-                    spec["python_package_spec"]["args"] = args
-
-                if environment_variables:
-                    spec["python_package_spec"]["env"] = [
-                        {"name": key, "value": value}
-                        for key, value in environment_variables.items()
-                    ]
+                spec["python_package_spec"] = dict(python_package_spec)
 
         (
             training_task_inputs,
@@ -8420,7 +8623,7 @@ class CustomPythonPackageTrainingJob(_CustomTrainingJob):
         )
 
         model = self._run_job(
-            training_task_definition=schema.training_job.definition.custom_task,
+            training_task_definition=_CUSTOM_TASK_DEFINITION,
             training_task_inputs=training_task_inputs,
             dataset=dataset,
             annotation_schema_uri=annotation_schema_uri,
@@ -8896,7 +9099,7 @@ class AutoMLVideoTrainingJob(_TrainingJob):
             create_request_timeout=create_request_timeout,
         )
 
-    @property
+    @functools.cached_property
     def _model_upload_fail_string(self) -> str:
         """Helper property for model upload failure."""
         return (
@@ -9014,6 +9217,12 @@ class AutoMLTextTrainingJob(_TrainingJob):
             model_encryption_spec_key_name=model_encryption_spec_key_name,
         )
 
+        # Deferred import: the schema trainingjob definition protos are only
+        # needed by text training jobs, so keep them off the SDK import path.
+        from google.cloud.aiplatform.v1.schema.trainingjob import (
+            definition_v1 as training_job_inputs,
+        )
+
         training_task_definition: str
         training_task_inputs_dict: proto.Message
 
@@ -9378,10 +9587,38 @@ class AutoMLTextTrainingJob(_TrainingJob):
             create_request_timeout=create_request_timeout,
         )
 
-    @property
+    @functools.cached_property
     def _model_upload_fail_string(self) -> str:
         """Helper property for model upload failure."""
         return (
             f"AutoML Text Training Pipeline {self.resource_name} is not "
             "configured to upload a Model."
         )
+
+
+# Training job methods carry multi-kilobyte docstrings that stay resident for
+# the life of the process. Server-side deployments that never call help() can
+# opt in to dropping them, mirroring what `python -OO` does without requiring
+# control over interpreter flags.
+if os.environ.get("AIP_STRIP_DOCSTRINGS"):
+    for _job_class in (
+        _TrainingJob,
+        _CustomTrainingJob,
+        _ForecastingTrainingJob,
+        CustomTrainingJob,
+        CustomContainerTrainingJob,
+        AutoMLTabularTrainingJob,
+        AutoMLForecastingTrainingJob,
+        SequenceToSequencePlusForecastingTrainingJob,
+        TemporalFusionTransformerForecastingTrainingJob,
+        TimeSeriesDenseEncoderForecastingTrainingJob,
+        AutoMLImageTrainingJob,
+        CustomPythonPackageTrainingJob,
+        AutoMLVideoTrainingJob,
+        AutoMLTextTrainingJob,
+    ):
+        for _method_name in ("run", "submit", "_run"):
+            _method = _job_class.__dict__.get(_method_name)
+            if _method is not None and getattr(_method, "__doc__", None):
+                _method.__doc__ = None
+    del _job_class, _method_name, _method
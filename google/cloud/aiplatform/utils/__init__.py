@@ -143,6 +143,14 @@ VertexAiServiceClient = TypeVar(
 
 RESOURCE_ID_PATTERN = re.compile(r"^[\w-]+$")
 
+# Resumable-upload chunk size for large GCS uploads, and the file size above
+# which it is applied. The storage client's default ~1 MiB chunks cost one
+# round trip each; 16 MiB (a multiple of the required 256 KiB) cuts that
+# overhead for big payloads. Small files keep the default single-request
+# upload, which avoids the resumable-session initiation round trip.
+_GCS_UPLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+_GCS_CHUNKED_UPLOAD_THRESHOLD = 16 * 1024 * 1024
+
 
 def validate_id(resource_id: str):
     """Validate resource ID.
@@ -280,12 +288,11 @@ def validate_labels(labels: Dict[str, str]):
     Raises:
         ValueError: if labels is not a mapping of string key value pairs.
     """
-    for k, v in labels.items():
-        if not isinstance(k, str) or not isinstance(v, str):
-            raise ValueError(
-                "Expect labels to be a mapping of string key value pairs. "
-                'Got "{}".'.format(labels)
-            )
+    if not all(isinstance(k, str) and isinstance(v, str) for k, v in labels.items()):
+        raise ValueError(
+            "Expect labels to be a mapping of string key value pairs. "
+            'Got "{}".'.format(labels)
+        )
 
 
 def validate_region(region: str) -> bool:
@@ -312,6 +319,11 @@ def validate_region(region: str) -> bool:
     return True
 
 
+# Valid accelerator type names, hoisted to a frozenset so the per-call
+# membership check below is a hash lookup rather than a list scan.
+_ACCELERATOR_TYPE_NAMES = frozenset(gca_accelerator_type.AcceleratorType._member_names_)
+
+
 def validate_accelerator_type(accelerator_type: str) -> bool:
     """Validates user provided accelerator_type string for training and
     prediction.
@@ -324,7 +336,7 @@ def validate_accelerator_type(accelerator_type: str) -> bool:
     Raises:
         ValueError if accelerator type is invalid.
     """
-    if accelerator_type not in gca_accelerator_type.AcceleratorType._member_names_:
+    if accelerator_type not in _ACCELERATOR_TYPE_NAMES:
         raise ValueError(
             f"Given accelerator_type `{accelerator_type}` invalid. "
             f"Choose one of {gca_accelerator_type.AcceleratorType._member_names_}"
@@ -1080,6 +1092,13 @@ def _timestamped_copy_to_gcs(
     client = storage.Client(project=project, credentials=credentials)
     bucket = client.bucket(gcs_bucket)
     blob = bucket.blob(blob_path)
+    try:
+        file_size = pathlib.Path(local_file_path).stat().st_size
+    except OSError:
+        # Let upload_from_filename surface the missing-file error.
+        file_size = 0
+    if file_size > _GCS_CHUNKED_UPLOAD_THRESHOLD:
+        blob.chunk_size = _GCS_UPLOAD_CHUNK_SIZE
     blob.upload_from_filename(local_file_path)
 
     gcs_path = "".join(["gs://", "/".join([blob.bucket.name, blob.name])])
@@ -30,6 +30,12 @@ from google.cloud.aiplatform import utils
 
 _LOGGER = base.Logger(__name__)
 
+# Uploaded training packages keyed by script identity (absolute path, mtime,
+# size), task module name, requirements, and upload destination. Re-submitting
+# an unchanged script skips the sdist rebuild and GCS upload. Directories are
+# never cached since editing a file inside one does not change its mtime.
+_package_upload_cache = {}
+
 
 def _get_python_executable() -> str:
     """Returns Python executable.
@@ -78,6 +84,8 @@ class _TrainingScriptPythonPackager:
     python -m aiplatform_custom_trainer_script.task
     """
 
+    __slots__ = ("script_path", "task_module_name", "requirements")
+
     _TRAINER_FOLDER = "trainer"
     _ROOT_MODULE = "aiplatform_custom_trainer_script"
     _SETUP_PY_VERSION = "0.1"
@@ -239,10 +247,33 @@ setup(
             GCS location of Python package.
         """
 
+        cache_key = None
+        if not os.path.isdir(self.script_path):
+            script_stat = os.stat(self.script_path)
+            cache_key = (
+                os.path.abspath(self.script_path),
+                script_stat.st_mtime_ns,
+                script_stat.st_size,
+                self.task_module_name,
+                tuple(self.requirements),
+                gcs_staging_dir,
+                project,
+            )
+            cached_package_uri = _package_upload_cache.get(cache_key)
+            if cached_package_uri is not None:
+                _LOGGER.info(
+                    "Reusing previously uploaded training script:\n%s."
+                    % cached_package_uri
+                )
+                return cached_package_uri
+
         copy_method = functools.partial(
             utils._timestamped_copy_to_gcs,
             gcs_dir=gcs_staging_dir,
             project=project,
             credentials=credentials,
         )
-        return self.package_and_copy(copy_method=copy_method)
+        package_uri = self.package_and_copy(copy_method=copy_method)
+        if cache_key is not None:
+            _package_upload_cache[cache_key] = package_uri
+        return package_uri
@@ -119,15 +119,13 @@ _TEST_TRAINING_TASK_INPUTS_DICT = {
     },
     "transformations": _TEST_TRAINING_COLUMN_TRANSFORMATIONS,
     "trainBudgetMilliNodeHours": _TEST_TRAINING_BUDGET_MILLI_NODE_HOURS,
-    # optional inputs
+    # optional inputs; unset optional inputs are omitted rather than sent as
+    # nulls, so None-valued test constants do not appear here
     "weightColumn": _TEST_TRAINING_WEIGHT_COLUMN,
-    "contextWindow": _TEST_TRAINING_CONTEXT_WINDOW,
     "exportEvaluatedDataItemsConfig": {
         "destinationBigqueryUri": _TEST_TRAINING_EXPORT_EVALUATED_DATA_ITEMS_BIGQUERY_DESTINATION_URI,
         "overrideExistingTable": _TEST_TRAINING_EXPORT_EVALUATED_DATA_ITEMS_OVERRIDE_DESTINATION,
     },
-    "quantiles": _TEST_TRAINING_QUANTILES,
-    "validationOptions": _TEST_TRAINING_VALIDATION_OPTIONS,
     "optimizationObjective": _TEST_TRAINING_OPTIMIZATION_OBJECTIVE_NAME,
     "hierarchyConfig": {
         "groupColumns": _TEST_HIERARCHY_GROUP_COLUMNS,
@@ -746,6 +744,78 @@ class TestForecastingTrainingJob:
                 holiday_regions=_TEST_TRAINING_HOLIDAY_REGIONS,
             )
 
+    @pytest.mark.parametrize(
+        "data_granularity_unit,data_granularity_count",
+        [("fortnight", 1), ("minute", 7)],
+    )
+    def test_run_with_invalid_data_granularity_raises(
+        self,
+        mock_pipeline_service_create,
+        mock_dataset_time_series,
+        data_granularity_unit,
+        data_granularity_count,
+    ):
+        aiplatform.init(project=_TEST_PROJECT, staging_bucket=_TEST_BUCKET_NAME)
+
+        job = training_jobs.AutoMLForecastingTrainingJob(
+            display_name=_TEST_DISPLAY_NAME,
+            optimization_objective=_TEST_TRAINING_OPTIMIZATION_OBJECTIVE_NAME,
+            column_transformations=_TEST_TRAINING_COLUMN_TRANSFORMATIONS,
+        )
+
+        with pytest.raises(ValueError, match="data_granularity"):
+            job.run(
+                dataset=mock_dataset_time_series,
+                target_column=_TEST_TRAINING_TARGET_COLUMN,
+                time_column=_TEST_TRAINING_TIME_COLUMN,
+                time_series_identifier_column=_TEST_TRAINING_TIME_SERIES_IDENTIFIER_COLUMN,
+                unavailable_at_forecast_columns=_TEST_TRAINING_UNAVAILABLE_AT_FORECAST_COLUMNS,
+                available_at_forecast_columns=_TEST_TRAINING_AVAILABLE_AT_FORECAST_COLUMNS,
+                forecast_horizon=_TEST_TRAINING_FORECAST_HORIZON,
+                data_granularity_unit=data_granularity_unit,
+                data_granularity_count=data_granularity_count,
+            )
+
+        mock_pipeline_service_create.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "training_fraction_split,validation_fraction_split,test_fraction_split",
+        [(-0.1, 0.8, 0.3), (0.8, 0.2, 0.2)],
+    )
+    def test_run_with_invalid_fraction_splits_raises(
+        self,
+        mock_pipeline_service_create,
+        mock_dataset_time_series,
+        training_fraction_split,
+        validation_fraction_split,
+        test_fraction_split,
+    ):
+        aiplatform.init(project=_TEST_PROJECT, staging_bucket=_TEST_BUCKET_NAME)
+
+        job = training_jobs.AutoMLForecastingTrainingJob(
+            display_name=_TEST_DISPLAY_NAME,
+            optimization_objective=_TEST_TRAINING_OPTIMIZATION_OBJECTIVE_NAME,
+            column_transformations=_TEST_TRAINING_COLUMN_TRANSFORMATIONS,
+        )
+
+        with pytest.raises(ValueError, match="Fraction splits"):
+            job.run(
+                dataset=mock_dataset_time_series,
+                target_column=_TEST_TRAINING_TARGET_COLUMN,
+                time_column=_TEST_TRAINING_TIME_COLUMN,
+                time_series_identifier_column=_TEST_TRAINING_TIME_SERIES_IDENTIFIER_COLUMN,
+                unavailable_at_forecast_columns=_TEST_TRAINING_UNAVAILABLE_AT_FORECAST_COLUMNS,
+                available_at_forecast_columns=_TEST_TRAINING_AVAILABLE_AT_FORECAST_COLUMNS,
+                forecast_horizon=_TEST_TRAINING_FORECAST_HORIZON,
+                data_granularity_unit=_TEST_TRAINING_DATA_GRANULARITY_UNIT,
+                data_granularity_count=_TEST_TRAINING_DATA_GRANULARITY_COUNT,
+                training_fraction_split=training_fraction_split,
+                validation_fraction_split=validation_fraction_split,
+                test_fraction_split=test_fraction_split,
+            )
+
+        mock_pipeline_service_create.assert_not_called()
+
     @mock.patch.object(training_jobs, "_JOB_WAIT_TIME", 1)
     @mock.patch.object(training_jobs, "_LOG_WAIT_TIME", 1)
     @pytest.mark.parametrize("sync", [True, False])
@@ -1413,3 +1483,46 @@ class TestForecastingTrainingJob:
             {"auto": {"column_name": "a"}},
             {"auto": {"column_name": "b"}},
         ]
+
+    @mock.patch.object(training_jobs, "_JOB_WAIT_TIME", 1)
+    @mock.patch.object(training_jobs, "_LOG_WAIT_TIME", 1)
+    @pytest.mark.usefixtures("mock_pipeline_service_get", "mock_model_service_get")
+    def test_run_many_submits_all_jobs(
+        self,
+        mock_pipeline_service_create,
+        mock_dataset_time_series,
+    ):
+        aiplatform.init(project=_TEST_PROJECT, staging_bucket=_TEST_BUCKET_NAME)
+
+        jobs_with_run_kwargs = []
+        for _ in range(2):
+            job = training_jobs.AutoMLForecastingTrainingJob(
+                display_name=_TEST_DISPLAY_NAME,
+                optimization_objective=_TEST_TRAINING_OPTIMIZATION_OBJECTIVE_NAME,
+                column_transformations=_TEST_TRAINING_COLUMN_TRANSFORMATIONS,
+            )
+            run_kwargs = dict(
+                dataset=mock_dataset_time_series,
+                target_column=_TEST_TRAINING_TARGET_COLUMN,
+                time_column=_TEST_TRAINING_TIME_COLUMN,
+                time_series_identifier_column=_TEST_TRAINING_TIME_SERIES_IDENTIFIER_COLUMN,
+                unavailable_at_forecast_columns=_TEST_TRAINING_UNAVAILABLE_AT_FORECAST_COLUMNS,
+                available_at_forecast_columns=_TEST_TRAINING_AVAILABLE_AT_FORECAST_COLUMNS,
+                forecast_horizon=_TEST_TRAINING_FORECAST_HORIZON,
+                data_granularity_unit=_TEST_TRAINING_DATA_GRANULARITY_UNIT,
+                data_granularity_count=_TEST_TRAINING_DATA_GRANULARITY_COUNT,
+                model_display_name=_TEST_MODEL_DISPLAY_NAME,
+            )
+            jobs_with_run_kwargs.append((job, run_kwargs))
+
+        models = training_jobs.AutoMLForecastingTrainingJob.run_many(
+            jobs_with_run_kwargs
+        )
+
+        assert len(models) == 2
+        assert mock_pipeline_service_create.call_count == 2
+        for job, _ in jobs_with_run_kwargs:
+            assert (
+                job._gca_resource.state
+                == gca_pipeline_state.PipelineState.PIPELINE_STATE_SUCCEEDED
+            )
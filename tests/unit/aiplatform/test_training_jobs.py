@@ -2559,6 +2559,104 @@ class TestCustomTrainingJob:
 
         assert model is None
 
+    @mock.patch.object(training_jobs, "_JOB_WAIT_TIME", 1)
+    @mock.patch.object(training_jobs, "_LOG_WAIT_TIME", 1)
+    @pytest.mark.usefixtures(
+        "mock_pipeline_service_get_with_no_model_to_upload",
+        "mock_python_package_to_gcs",
+    )
+    def test_submit_many_submits_all_jobs(
+        self,
+        mock_pipeline_service_create_with_no_model_to_upload,
+        mock_tabular_dataset,
+    ):
+        aiplatform.init(project=_TEST_PROJECT, staging_bucket=_TEST_BUCKET_NAME)
+
+        jobs_with_submit_kwargs = []
+        for _ in range(2):
+            job = training_jobs.CustomTrainingJob(
+                display_name=_TEST_DISPLAY_NAME,
+                script_path=_TEST_LOCAL_SCRIPT_FILE_NAME,
+                container_uri=_TEST_TRAINING_CONTAINER_IMAGE,
+            )
+            submit_kwargs = dict(
+                dataset=mock_tabular_dataset,
+                base_output_dir=_TEST_BASE_OUTPUT_DIR,
+                args=_TEST_RUN_ARGS,
+                replica_count=1,
+                machine_type=_TEST_MACHINE_TYPE,
+                accelerator_type=_TEST_ACCELERATOR_TYPE,
+                accelerator_count=_TEST_ACCELERATOR_COUNT,
+                create_request_timeout=None,
+            )
+            jobs_with_submit_kwargs.append((job, submit_kwargs))
+
+        model_futures = training_jobs.CustomTrainingJob.submit_many(
+            jobs_with_submit_kwargs
+        )
+
+        # Jobs that are not configured to upload a model yield None entries.
+        assert model_futures == [None, None]
+        assert mock_pipeline_service_create_with_no_model_to_upload.call_count == 2
+        for job, _ in jobs_with_submit_kwargs:
+            assert job._gca_resource.name == _TEST_PIPELINE_RESOURCE_NAME
+
+    def test_run_with_too_many_environment_variables_raises(
+        self,
+        mock_tabular_dataset,
+    ):
+        aiplatform.init(project=_TEST_PROJECT, staging_bucket=_TEST_BUCKET_NAME)
+
+        job = training_jobs.CustomTrainingJob(
+            display_name=_TEST_DISPLAY_NAME,
+            script_path=_TEST_LOCAL_SCRIPT_FILE_NAME,
+            container_uri=_TEST_TRAINING_CONTAINER_IMAGE,
+        )
+
+        with pytest.raises(ValueError, match="At most 10 environment variables"):
+            job.run(
+                dataset=mock_tabular_dataset,
+                base_output_dir=_TEST_BASE_OUTPUT_DIR,
+                environment_variables={"KEY_%d" % i: "value" for i in range(11)},
+            )
+
+    def test_run_with_invalid_boot_disk_size_raises(
+        self,
+        mock_tabular_dataset,
+    ):
+        aiplatform.init(project=_TEST_PROJECT, staging_bucket=_TEST_BUCKET_NAME)
+
+        job = training_jobs.CustomTrainingJob(
+            display_name=_TEST_DISPLAY_NAME,
+            script_path=_TEST_LOCAL_SCRIPT_FILE_NAME,
+            container_uri=_TEST_TRAINING_CONTAINER_IMAGE,
+        )
+
+        with pytest.raises(ValueError, match="boot_disk_size_gb must be within"):
+            job.run(
+                dataset=mock_tabular_dataset,
+                base_output_dir=_TEST_BASE_OUTPUT_DIR,
+                boot_disk_size_gb=99,
+            )
+
+    def test_prepare_and_validate_run_skip_validation_bypasses_boot_disk_check(
+        self,
+    ):
+        aiplatform.init(project=_TEST_PROJECT, staging_bucket=_TEST_BUCKET_NAME)
+
+        job = training_jobs.CustomTrainingJob(
+            display_name=_TEST_DISPLAY_NAME,
+            script_path=_TEST_LOCAL_SCRIPT_FILE_NAME,
+            container_uri=_TEST_TRAINING_CONTAINER_IMAGE,
+        )
+
+        worker_pool_specs, _ = job._prepare_and_validate_run(
+            boot_disk_size_gb=99,
+            skip_validation=True,
+        )
+
+        assert worker_pool_specs[0]["disk_spec"]["boot_disk_size_gb"] == 99
+
     @mock.patch.object(training_jobs, "_JOB_WAIT_TIME", 1)
     @mock.patch.object(training_jobs, "_LOG_WAIT_TIME", 1)
     @pytest.mark.usefixtures(